@@ -56,7 +56,7 @@ def all(args, config: Config):
                 method="DELETE",
                 data={},
             )
-            action.note(f"{resp.status}")
+            action.note(f"{resp.status_code}")
 
     with Action("Getting list of servers"):
         servers: list[BoundServer] = client.servers.get_all()
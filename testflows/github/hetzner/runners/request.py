@@ -13,13 +13,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json as json
+import threading
+
+import requests
 
-from http.client import HTTPResponse
-from urllib.request import urlopen, Request, HTTPError
 from . import __version__ as project_version, __name__ as project_name
 
 user_agent = f"{project_name}/{project_version}"
 
+session_lock = threading.Lock()
+session: requests.Session = None
+
+
+def get_session():
+    """Return the shared HTTP session.
+
+    The session is created on first use so that any globally installed
+    requests cache is picked up, and is shared by all callers so that
+    keep-alive connections are reused instead of performing a new
+    TCP/TLS handshake per request.
+    """
+    global session
+
+    with session_lock:
+        if session is None:
+            session = requests.Session()
+        return session
+
+
 def request(
     url,
     headers=None,
@@ -27,41 +48,27 @@ def request(
     format=None,
     encoding="utf-8",
     timeout=60,
-    process_error=True,
     method=None,
 ):
-    """Perform URL request."""
+    """Perform URL request using the shared keep-alive session."""
     if headers is None:
         headers = {}
 
     headers["User-Agent"] = user_agent
 
-    r = Request(url, headers=headers, data=data, method=method)
-
-    try:
-        with urlopen(r, timeout=timeout) as response:
-            response: HTTPResponse = response
-
-            data = response.read()
-            if encoding:
-                data = data.decode(encoding)
-            if format == "json":
-                data = json.loads(data)
-
-            return data, response
-    except HTTPError as exc:
-        if not process_error:
-            raise
-
-        if exc.getcode() in (307, 308):
-            # process 307 (Temporary Redirect") and 308 (Permanent Redirect)
-            error_data = json.loads(exc.read().decode(encoding))
-            return request(
-                url=error_data["url"],
-                headers=headers,
-                data=data,
-                format=format,
-                encoding=encoding,
-                timeout=timeout,
-                process_error=False,
-            )
+    if method is None:
+        method = "GET" if data is None else "POST"
+
+    response = get_session().request(
+        method, url, headers=headers, data=data, timeout=timeout
+    )
+
+    response.raise_for_status()
+
+    data = response.content
+    if encoding:
+        data = data.decode(encoding)
+    if format == "json":
+        data = json.loads(data)
+
+    return data, response
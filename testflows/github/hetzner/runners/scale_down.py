@@ -103,7 +103,7 @@ def delete_recyclable_server(
 
     picking = "randomly picked"
     if server_prices is None:
-        random.shuffle(recyclable_servers)
+        recyclable_server = random.choice(recyclable_servers)
     else:
         picking = "the cheapest"
 
@@ -124,9 +124,9 @@ def delete_recyclable_server(
                 ):
                     return math.inf
 
-        recyclable_servers.sort(key=sorting_key, reverse=True)
+        recyclable_server = min(recyclable_servers, key=sorting_key)
 
-    recyclable_server = recyclable_servers.pop()
+    recyclable_servers.remove(recyclable_server)
 
     with Action(
         f"Deleting {picking} recyclable server {recyclable_server.name} with type "
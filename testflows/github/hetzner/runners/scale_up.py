@@ -129,23 +129,27 @@ def server_setup(
         )
         GITHUB_RUNNER_TOKEN = content["token"]
 
-    with Action("Executing setup.sh script", server_name=server.name):
-        ssh(server, f"bash -s  < {setup_script}", stacklevel=5)
-
-    with Action("Executing startup.sh script", server_name=server.name):
-        ssh(
-            server,
-            f"'sudo -u ubuntu "
-            f'GITHUB_REPOSITORY="{github_repository}" '
-            f'GITHUB_RUNNER_TOKEN="{GITHUB_RUNNER_TOKEN}" '
-            f"GITHUB_RUNNER_GROUP=Default "
-            f'GITHUB_RUNNER_LABELS="{runner_labels}" '
-            f'SERVER_ID="{server.id}" '
-            f'SERVER_TYPE_NAME="{server.server_type.name}" '
-            f'SERVER_LOCATION_NAME="{server.datacenter.location.name}" '
-            f"bash -s' < {startup_script}",
-            stacklevel=5,
-        )
+    with Action("Executing setup.sh and startup.sh scripts", server_name=server.name):
+        with open(setup_script, "r") as setup:
+            with open(startup_script, "r") as startup:
+                # batch both scripts into a single SSH session where
+                # the startup script is passed to the runner's user
+                # shell using a quoted heredoc
+                script = (
+                    setup.read() + "\n"
+                    "sudo -u ubuntu "
+                    f'GITHUB_REPOSITORY="{github_repository}" '
+                    f'GITHUB_RUNNER_TOKEN="{GITHUB_RUNNER_TOKEN}" '
+                    f"GITHUB_RUNNER_GROUP=Default "
+                    f'GITHUB_RUNNER_LABELS="{runner_labels}" '
+                    f'SERVER_ID="{server.id}" '
+                    f'SERVER_TYPE_NAME="{server.server_type.name}" '
+                    f'SERVER_LOCATION_NAME="{server.datacenter.location.name}" '
+                    "bash -s <<'STARTUP_SCRIPT'\n"
+                    f"{startup.read()}\n"
+                    "STARTUP_SCRIPT\n"
+                )
+        ssh(server, "bash -s", input=script, stacklevel=5)
 
 
 def get_server_type(labels: set[str], default: ServerType, label_prefix: str = ""):
@@ -197,9 +201,17 @@ def get_server_location(
 
 
 def get_server_image(
-    client: Client, labels: set[str], default: Image, label_prefix: str = ""
+    client: Client,
+    labels: set[str],
+    default: Image,
+    label_prefix: str = "",
+    cache: dict[str, Image] = None,
 ):
-    """Get preferred server image for the specified job."""
+    """Get preferred server image for the specified job.
+
+    Optional cache maps image labels to previously looked up images
+    to avoid repeating the same image lookup API calls.
+    """
     server_image: Image = None
 
     if label_prefix and not label_prefix.endswith("-"):
@@ -210,10 +222,15 @@ def get_server_image(
     for label in labels:
         label = label.lower()
         if label.startswith(label_prefix):
-            server_image = check_image(
-                client,
-                image_type(label.split(label_prefix, 1)[-1].lower(), separator="-"),
-            )
+            if cache is not None and label in cache:
+                server_image = cache[label]
+            else:
+                server_image = check_image(
+                    client,
+                    image_type(label.split(label_prefix, 1)[-1].lower(), separator="-"),
+                )
+                if cache is not None:
+                    cache[label] = server_image
 
     if server_image is None:
         server_image = default
@@ -313,7 +330,7 @@ def raise_exception(exc):
 
 
 def create_server(
-    hetzner_token: str,
+    client: Client,
     setup_worker_pool: ThreadPoolExecutor,
     labels: set[str],
     name: str,
@@ -328,8 +345,6 @@ def create_server(
     timeout=60,
 ):
     """Create specified number of server instances."""
-    client = Client(token=hetzner_token)
-
     server_labels = {
         f"github-hetzner-runner-label-{i}": value for i, value in enumerate(labels)
     }
@@ -365,7 +380,7 @@ def create_server(
 
 def recycle_server(
     server_name: str,
-    hetzner_token: str,
+    client: Client,
     setup_worker_pool: ThreadPoolExecutor,
     labels: set[str],
     name: str,
@@ -378,8 +393,6 @@ def recycle_server(
     timeout=60,
 ):
     """Create specified number of server instances."""
-    client = Client(token=hetzner_token, poll_interval=1)
-
     server_labels = {
         f"github-hetzner-runner-label-{i}": value for i, value in enumerate(labels)
     }
@@ -411,6 +424,54 @@ def recycle_server(
     )
 
 
+def servers_label_index(servers: list[RunnerServer]):
+    """Build inverted label index (label -> servers by name) used to
+    answer label subset queries without scanning all servers."""
+    index: dict[str, dict[str, RunnerServer]] = {}
+
+    for server in servers:
+        index_server_labels(index=index, server=server)
+
+    return index
+
+
+def index_server_labels(index: dict[str, dict[str, RunnerServer]], server: RunnerServer):
+    """Add server to the inverted label index."""
+    for label in server.labels:
+        index.setdefault(label, {})[server.name] = server
+
+
+def unindex_server_labels(
+    index: dict[str, dict[str, RunnerServer]], server: RunnerServer
+):
+    """Remove server from the inverted label index."""
+    for label in server.labels:
+        posting = index.get(label)
+        if posting is not None:
+            posting.pop(server.name, None)
+
+
+def servers_matching_labels(
+    index: dict[str, dict[str, RunnerServer]], labels: set[str]
+):
+    """Return servers whose labels are a superset of the specified labels."""
+    postings = []
+
+    for label in labels:
+        posting = index.get(label)
+        if not posting:
+            return []
+        postings.append(posting)
+
+    postings.sort(key=len)
+
+    names = set(postings[0])
+    for posting in postings[1:]:
+        names &= posting.keys()
+
+    return [postings[0][name] for name in names]
+
+
 def count_available_runners(runners: list[SelfHostedActionsRunner], labels: set[str]):
     """Return number of available runners that match labels (subset)."""
     count = 0
@@ -425,29 +486,57 @@ def count_available_runners(runners: list[SelfHostedActionsRunner], labels: set[
     return count
 
 
-def count_available(servers: list[RunnerServer], labels: set[str]):
-    """Return number of available servers that match labels (subset)."""
+def count_available(
+    servers: list[RunnerServer],
+    labels: set[str],
+    index: dict[str, dict[str, RunnerServer]] = None,
+    required: int = None,
+):
+    """Return number of available servers that match labels (subset).
+
+    Stops counting as soon as the required number is reached.
+    """
     count = 0
 
+    if index is not None and labels:
+        servers = servers_matching_labels(index=index, labels=labels)
+
     for runner_server in servers:
+        if required is not None and count >= required:
+            break
         if runner_server.server_status == Server.STATUS_OFF:
             continue
-        if labels.issubset(runner_server.labels):
-            if runner_server.status in ("initializing", "ready"):
-                count += 1
+        if index is None and not labels.issubset(runner_server.labels):
+            continue
+        if runner_server.status in ("initializing", "ready"):
+            count += 1
 
     return count
 
 
-def count_present(servers: list[RunnerServer], labels: set[str]):
-    """Return number of present servers that match labels (subset)."""
+def count_present(
+    servers: list[RunnerServer],
+    labels: set[str],
+    index: dict[str, dict[str, RunnerServer]] = None,
+    required: int = None,
+):
+    """Return number of present servers that match labels (subset).
+
+    Stops counting as soon as the required number is reached.
+    """
     count = 0
 
+    if index is not None and labels:
+        servers = servers_matching_labels(index=index, labels=labels)
+
     for runner_server in servers:
+        if required is not None and count >= required:
+            break
         if runner_server.server_status == Server.STATUS_OFF:
             continue
-        if labels.issubset(runner_server.labels):
-            count += 1
+        if index is None and not labels.issubset(runner_server.labels):
+            continue
+        count += 1
 
     return count
 
@@ -459,45 +548,50 @@ def max_servers_in_workflow_run_reached(
     server_name: str = None,
 ):
     """Return True if maximum number of servers in workflow run has been reached."""
-    with Action(
-        f"Check maximum number of servers used in workflow run {run_id}",
-        level=logging.DEBUG,
-        stacklevel=3,
-        run_id=run_id,
-        server_name=server_name,
-    ):
-        run_server_name_prefix = f"{server_name_prefix}{run_id}"
-        servers_in_run = [
-            server
-            for server in servers
-            if server.name.startswith(run_server_name_prefix)
-        ]
-        if len(servers_in_run) >= max_servers_in_workflow_run:
-            with Action(
-                f"Maximum number of servers {max_servers_in_workflow_run} for {run_id} has been reached",
-                stacklevel=3,
-                run_id=run_id,
-                server_name=server_name,
-            ):
-                return True
+    if logger.isEnabledFor(logging.DEBUG):
+        with Action(
+            f"Check maximum number of servers used in workflow run {run_id}",
+            level=logging.DEBUG,
+            stacklevel=3,
+            run_id=run_id,
+            server_name=server_name,
+        ):
+            pass
+    run_server_name_prefix = f"{server_name_prefix}{run_id}"
+    servers_in_run = [
+        server for server in servers if server.name.startswith(run_server_name_prefix)
+    ]
+    if len(servers_in_run) >= max_servers_in_workflow_run:
+        with Action(
+            f"Maximum number of servers {max_servers_in_workflow_run} for {run_id} has been reached",
+            stacklevel=3,
+            run_id=run_id,
+            server_name=server_name,
+        ):
+            return True
     return False
 
 
-def recyclable_server_match(
-    server: BoundServer,
-    server_type: ServerType,
-    server_location: Location,
-    ssh_key: SSHKey,
-):
-    """Check if a recyclable server matches for the specified
-    server type, location and ssh key."""
-    if server.server_type.name != server_type.name:
-        return False
+def recyclable_server_key(server: RunnerServer, ssh_key_name: str = None):
+    """Return (server type, server location, ssh key) key used to
+    index recyclable servers."""
+    if ssh_key_name is None:
+        ssh_key_name = server.server.labels.get(server_ssh_key_label)
+    return (server.server_type.name, server.server_location.name, ssh_key_name)
+
 
-    if server_location and server.server_location.name != server_location.name:
-        return False
+def recyclable_servers_index(servers: list[RunnerServer], exclude: set[str] = None):
+    """Index recyclable servers by their (server type, server location,
+    ssh key) key, skipping any excluded server names."""
+    index: dict[tuple[str, str, str], list[RunnerServer]] = {}
 
-    return ssh_key.name == server.server.labels.get(server_ssh_key_label)
+    for server in servers:
+        if server.name.startswith(recycle_server_name_prefix):
+            if exclude and server.name in exclude:
+                continue
+            index.setdefault(recyclable_server_key(server), []).append(server)
+
+    return index
 
 
 def scale_up(
@@ -525,6 +619,7 @@ def scale_up(
     label_prefix: str = config.label_prefix
     meta_label: dict[str, set[str]] = config.meta_label
     scripts: str = config.scripts
+    server_images: dict[str, Image] = {}
     interval: int = -1
 
     with Action("Logging in to Hetzner Cloud"):
@@ -536,10 +631,11 @@ def scale_up(
         setup_worker_pool: ThreadPoolExecutor,
         futures: list[Future],
         servers: list[RunnerServer],
+        servers_by_name: dict[str, RunnerServer],
+        recyclable_servers: dict[tuple[str, str, str], list[RunnerServer]],
+        labels_index: dict[str, dict[str, RunnerServer]],
     ):
         """Create new server that would provide a runner with given labels."""
-        recyclable_servers: list[BoundServer] = []
-
         labels = expand_meta_label(meta_label=meta_label, labels=labels)
 
         server_type = get_server_type(
@@ -553,6 +649,7 @@ def scale_up(
             labels=labels,
             default=default_image,
             label_prefix=label_prefix,
+            cache=server_images,
         )
         setup_script = get_setup_script(
             scripts=scripts,
@@ -566,68 +663,74 @@ def scale_up(
             label_prefix=label_prefix,
         )
 
-        with Action(
-            f"Trying to create server {name}",
-            stacklevel=3,
-            level=logging.DEBUG,
-            server_name=name,
-        ):
-            pass
+        if logger.isEnabledFor(logging.DEBUG):
+            with Action(
+                f"Trying to create server {name}",
+                stacklevel=3,
+                level=logging.DEBUG,
+                server_name=name,
+            ):
+                pass
 
         if recycle:
-            for server in servers:
-                if server.name.startswith(recycle_server_name_prefix):
-                    recyclable_servers.append(server)
+            server: RunnerServer = None
+
+            if server_location is not None:
+                candidates = recyclable_servers.get(
+                    (server_type.name, server_location.name, ssh_keys[0].name)
+                )
+                if candidates:
+                    server = candidates.pop(0)
+            else:
+                # no location preference, any recyclable server with
+                # the matching server type and ssh key will do
+                for key, candidates in recyclable_servers.items():
+                    if key[0] == server_type.name and key[2] == ssh_keys[0].name:
+                        if candidates:
+                            server = candidates.pop(0)
+                            break
+
+            if server is not None:
+                if logger.isEnabledFor(logging.DEBUG):
                     with Action(
-                        f"Checking if we can recycle {server.name}",
+                        f"Recycling server {server.name} to make {name}",
                         stacklevel=3,
                         level=logging.DEBUG,
                         server_name=name,
                     ):
                         pass
-
-                    if recyclable_server_match(
-                        server=server,
-                        server_type=server_type,
-                        server_location=server_location,
-                        ssh_key=ssh_keys[0],
-                    ):
-                        future = worker_pool.submit(
-                            recycle_server,
-                            server_name=server.name,
-                            hetzner_token=hetzner_token,
-                            setup_worker_pool=setup_worker_pool,
-                            labels=labels,
-                            name=name,
-                            server_image=server_image,
-                            startup_script=startup_script,
-                            setup_script=setup_script,
-                            github_token=github_token,
-                            github_repository=github_repository,
-                            ssh_key=ssh_keys[0],
-                            timeout=max_server_ready_time,
-                        )
-                        future.server_name = name
-                        future.server_labels = labels
-                        futures.append(future)
-                        servers.pop(servers.index(server))
-                        servers.append(
-                            RunnerServer(
-                                name=name,
-                                server_type=server_type,
-                                server_location=server_location,
-                                labels=labels,
-                            )
-                        )
-                        return
-                    else:
-                        with Action(
-                            f"Recyclable server {server.name} did not match {name}",
-                            stacklevel=3,
-                            level=logging.DEBUG,
-                            server_name=name,
-                        ):
-                            pass
+                future = worker_pool.submit(
+                    recycle_server,
+                    server_name=server.name,
+                    client=client,
+                    setup_worker_pool=setup_worker_pool,
+                    labels=labels,
+                    name=name,
+                    server_image=server_image,
+                    startup_script=startup_script,
+                    setup_script=setup_script,
+                    github_token=github_token,
+                    github_repository=github_repository,
+                    ssh_key=ssh_keys[0],
+                    timeout=max_server_ready_time,
+                )
+                future.server_name = name
+                future.server_labels = labels
+                future.recycled_server_name = server.name
+                futures.append(future)
+                servers.pop(servers.index(server))
+                servers_by_name.pop(server.name, None)
+                unindex_server_labels(index=labels_index, server=server)
+                runner_server = RunnerServer(
+                    name=name,
+                    server_type=server_type,
+                    server_location=server_location,
+                    labels=labels,
+                )
+                servers.append(runner_server)
+                servers_by_name[name] = runner_server
+                index_server_labels(index=labels_index, server=runner_server)
+                return
 
         if max_servers is not None:
             if len(servers) >= max_servers:
@@ -649,7 +752,7 @@ def scale_up(
 
         future = worker_pool.submit(
             create_server,
-            hetzner_token=hetzner_token,
+            client=client,
             setup_worker_pool=setup_worker_pool,
             labels=labels,
             name=name,
@@ -666,14 +769,15 @@ def scale_up(
         future.server_name = name
         future.server_labels = labels
         futures.append(future)
-        servers.append(
-            RunnerServer(
-                name=name,
-                server_type=server_type,
-                server_location=server_location,
-                labels=labels,
-            )
+        runner_server = RunnerServer(
+            name=name,
+            server_type=server_type,
+            server_location=server_location,
+            labels=labels,
         )
+        servers.append(runner_server)
+        servers_by_name[name] = runner_server
+        index_server_labels(index=labels_index, server=runner_server)
 
     with Action("Logging in to GitHub"):
         github = Github(login_or_token=github_token, per_page=100)
@@ -682,8 +786,17 @@ def scale_up(
         repo: Repository = github.get_repo(github_repository)
 
     with ThreadPoolExecutor(
-        max_workers=worker_pool._max_workers, thread_name_prefix=f"setup-worker"
+        max_workers=config.workers, thread_name_prefix=f"setup-worker"
     ) as setup_worker_pool:
+        in_flight: list[Future] = []
+        last_servers: list[RunnerServer] = None
+        last_labels_index: dict[str, dict[str, RunnerServer]] = None
+        # number of consecutive idle intervals after which a full
+        # server/runner refresh is forced when standby runners are
+        # configured, as the cached snapshot goes stale while idle
+        max_idle_intervals: int = 4
+        idle_intervals: int = 0
+
         while True:
             interval += 1
             if terminate.is_set():
@@ -691,14 +804,75 @@ def scale_up(
                     break
 
             try:
+                futures: list[Future] = []
+                stolen_runner_labels: dict[int, set[str]] = {}
+
                 with Action(
                     "Getting workflow runs", level=logging.DEBUG, interval=interval
                 ):
-                    workflow_runs: list[WorkflowRun] = repo.get_workflow_runs(
-                        status="queued"
+                    workflow_runs: list[WorkflowRun] = list(
+                        repo.get_workflow_runs(status="queued")
                     )
 
-                futures: list[Future] = []
+                if not workflow_runs and not in_flight:
+                    # check for standby runner deficit using the
+                    # snapshot from the last full iteration unless
+                    # the snapshot is missing or has gone stale
+                    skip = True
+                    if standby_runners:
+                        if (
+                            last_servers is None
+                            or idle_intervals >= max_idle_intervals
+                        ):
+                            skip = False
+                        else:
+                            for standby_runner in standby_runners:
+                                labels = set(standby_runner.labels)
+                                if standby_runner.replenish_immediately:
+                                    available = count_available(
+                                        servers=last_servers,
+                                        labels=labels,
+                                        index=last_labels_index,
+                                        required=standby_runner.count,
+                                    )
+                                else:
+                                    available = count_present(
+                                        servers=last_servers,
+                                        labels=labels,
+                                        index=last_labels_index,
+                                        required=standby_runner.count,
+                                    )
+                                if available < standby_runner.count:
+                                    skip = False
+                                    break
+
+                    if skip:
+                        idle_intervals += 1
+                        with Action(
+                            "No queued jobs, skipping server and runner checks",
+                            level=logging.DEBUG,
+                            interval=interval,
+                        ):
+                            time.sleep(interval_period)
+                        continue
+
+                idle_intervals = 0
+
+                with Action(
+                    "Requesting servers and self-hosted runners",
+                    level=logging.DEBUG,
+                    interval=interval,
+                ):
+                    # filter servers Hetzner-side by the ssh key label that
+                    # all runner servers carry to cut the pages returned
+                    servers_future = worker_pool.submit(
+                        lambda: list(
+                            client.servers.get_all(label_selector=server_ssh_key_label)
+                        )
+                    )
+                    runners_future = worker_pool.submit(
+                        lambda: list(repo.get_self_hosted_runners())
+                    )
 
                 with Action(
                     "Getting list of servers", level=logging.DEBUG, interval=interval
@@ -718,9 +892,35 @@ def scale_up(
                             server_location=server.datacenter.location,
                             server=server,
                         )
-                        for server in client.servers.get_all()
+                        for server in servers_future.result()
                         if server.name.startswith(server_name_prefix)
                     ]
+                    servers_by_name = {server.name: server for server in servers}
+
+                    # servers whose creation or recycling is still in
+                    # flight may not be visible in the snapshot yet, so
+                    # add placeholders for them to not create them again
+                    # and exclude servers being recycled from recycling
+                    in_flight_recycled: set[str] = set()
+                    for future in in_flight:
+                        in_flight_recycled.add(
+                            getattr(future, "recycled_server_name", None)
+                        )
+                        if future.server_name not in servers_by_name:
+                            runner_server = RunnerServer(
+                                name=future.server_name,
+                                labels=future.server_labels,
+                                server_type=None,
+                                server_location=None,
+                            )
+                            servers.append(runner_server)
+                            servers_by_name[future.server_name] = runner_server
+
+                    recyclable_servers = recyclable_servers_index(
+                        servers, exclude=in_flight_recycled
+                    )
+                    labels_index = servers_label_index(servers)
+                    last_servers, last_labels_index = servers, labels_index
 
                 with Action(
                     "Getting list of self-hosted runners",
@@ -729,7 +929,7 @@ def scale_up(
                 ):
                     runners: list[SelfHostedActionsRunner] = [
                         runner
-                        for runner in repo.get_self_hosted_runners()
+                        for runner in runners_future.result()
                         if runner.name.startswith(runner_name_prefix)
                     ]
 
@@ -739,44 +939,58 @@ def scale_up(
                     interval=interval,
                 ):
                     for runner in runners:
-                        for server in servers:
-                            if runner.name.startswith(server.name):
-                                if runner.status == "online":
-                                    server.status = "busy" if runner.busy else "ready"
+                        server = servers_by_name.get(
+                            get_runner_server_name(runner.name)
+                        )
+                        if server is not None:
+                            if runner.status == "online":
+                                server.status = "busy" if runner.busy else "ready"
 
                 with Action(
                     "Looking for queued jobs", level=logging.DEBUG, interval=interval
                 ):
                     try:
-                        for run in workflow_runs:
-                            with Action(
-                                f"Checking jobs for workflow run {run}",
-                                level=logging.DEBUG,
-                                run_id=run.id,
-                                interval=interval,
-                            ):
-                                pass
-                            if max_servers_in_workflow_run is not None:
-                                if max_servers_in_workflow_run_reached(
+                        # do not fetch jobs for runs that already reached
+                        # the maximum number of servers in the workflow run
+                        runs: list[WorkflowRun] = workflow_runs
+                        if max_servers_in_workflow_run is not None:
+                            runs = [
+                                run
+                                for run in workflow_runs
+                                if not max_servers_in_workflow_run_reached(
                                     run_id=run.id,
                                     servers=servers,
                                     max_servers_in_workflow_run=max_servers_in_workflow_run,
-                                ):
-                                    continue
-
-                            for job in run.jobs():
-                                if terminate.is_set():
-                                    raise StopIteration("terminating")
-
+                                )
+                            ]
+                        jobs_futures: list[Future] = [
+                            worker_pool.submit(lambda r=r: list(r.jobs()))
+                            for r in runs
+                        ]
+                        for run, jobs_future in zip(runs, jobs_futures):
+                            if logger.isEnabledFor(logging.DEBUG):
                                 with Action(
-                                    f"Checking job {job} {job.status}",
+                                    f"Checking jobs for workflow run {run}",
                                     level=logging.DEBUG,
                                     run_id=run.id,
-                                    job_id=job.id,
                                     interval=interval,
                                 ):
                                     pass
 
+                            for job in jobs_future.result():
+                                if terminate.is_set():
+                                    raise StopIteration("terminating")
+
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    with Action(
+                                        f"Checking job {job} {job.status}",
+                                        level=logging.DEBUG,
+                                        run_id=run.id,
+                                        job_id=job.id,
+                                        interval=interval,
+                                    ):
+                                        pass
+
                                 labels = set(
                                     [label.lower() for label in job.raw_data["labels"]]
                                 )
@@ -786,16 +1000,16 @@ def scale_up(
                                 )
 
                                 if job.status != "completed":
-                                    if server_name in [
-                                        server.name for server in servers
-                                    ]:
-                                        with Action(
-                                            f"Server already exists for {job.status} {job}",
-                                            level=logging.DEBUG,
-                                            server_name=server_name,
-                                            interval=interval,
-                                        ):
-                                            continue
+                                    if server_name in servers_by_name:
+                                        if logger.isEnabledFor(logging.DEBUG):
+                                            with Action(
+                                                f"Server already exists for {job.status} {job}",
+                                                level=logging.DEBUG,
+                                                server_name=server_name,
+                                                interval=interval,
+                                            ):
+                                                pass
+                                        continue
 
                                     if job.status == "in_progress":
                                         # skip jobs that were assigned to some other runners
@@ -815,14 +1029,17 @@ def scale_up(
                                             server_name=server_name,
                                             interval=interval,
                                         ):
-                                            labels = set(
-                                                [
-                                                    label["name"].lower()
-                                                    for label in repo.get_self_hosted_runner(
-                                                        job.raw_data["runner_id"]
-                                                    ).labels()
-                                                ]
-                                            )
+                                            runner_id = job.raw_data["runner_id"]
+                                            if runner_id not in stolen_runner_labels:
+                                                stolen_runner_labels[runner_id] = set(
+                                                    [
+                                                        label["name"].lower()
+                                                        for label in repo.get_self_hosted_runner(
+                                                            runner_id
+                                                        ).labels()
+                                                    ]
+                                                )
+                                            labels = stolen_runner_labels[runner_id]
 
                                     if max_servers_in_workflow_run is not None:
                                         if max_servers_in_workflow_run_reached(
@@ -870,6 +1087,9 @@ def scale_up(
                                             setup_worker_pool=setup_worker_pool,
                                             futures=futures,
                                             servers=servers,
+                                            servers_by_name=servers_by_name,
+                                            recyclable_servers=recyclable_servers,
+                                            labels_index=labels_index,
                                         )
                     except StopIteration:
                         pass
@@ -881,11 +1101,17 @@ def scale_up(
                             replenish_immediately = standby_runner.replenish_immediately
                             if replenish_immediately:
                                 available = count_available(
-                                    servers=servers, labels=labels
+                                    servers=servers,
+                                    labels=labels,
+                                    index=labels_index,
+                                    required=standby_runner.count,
                                 )
                             else:
                                 available = count_present(
-                                    servers=servers, labels=labels
+                                    servers=servers,
+                                    labels=labels,
+                                    index=labels_index,
+                                    required=standby_runner.count,
                                 )
 
                             if available < standby_runner.count:
@@ -903,13 +1129,23 @@ def scale_up(
                                                 setup_worker_pool=setup_worker_pool,
                                                 futures=futures,
                                                 servers=servers,
+                                                servers_by_name=servers_by_name,
+                                                recyclable_servers=recyclable_servers,
+                                                labels_index=labels_index,
                                             )
                                     except StopIteration:
                                         break
 
-                for future in futures:
+                # only check futures that are done so that server creation
+                # does not delay the next look at the queue
+                in_flight.extend(futures)
+
+                for future in in_flight[:]:
+                    if not future.done():
+                        continue
+                    in_flight.remove(future)
                     with Action(
-                        f"Waiting to finish creating server {future.server_name}",
+                        f"Finishing creating server {future.server_name}",
                         ignore_fail=True,
                         server_name=future.server_name,
                         interval=interval,
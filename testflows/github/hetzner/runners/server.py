@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import time
+import socket
+import threading
 
 from datetime import datetime, timezone
 from collections import namedtuple
@@ -24,6 +26,12 @@ from .shell import shell
 
 ServerAge = namedtuple("ServerAge", "days hours minutes seconds")
 
+# maximum number of concurrent SSH connection attempts to new servers;
+# matches the default sshd MaxStartups limit so that a burst of booting
+# servers does not get handshakes dropped or delayed
+max_ssh_startups = 10
+ssh_startups = threading.BoundedSemaphore(max_ssh_startups)
+
 
 def age(server: BoundServer):
     """Return server's age."""
@@ -41,11 +49,21 @@ def ip_address(server: BoundServer):
     return server.public_net.primary_ipv4.ip
 
 
+def port_open(ip: str, port: int = 22, timeout: float = 2):
+    """Check if TCP port accepts connections."""
+    try:
+        with socket.create_connection((ip, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
 def wait_ssh(server: BoundServer, timeout: float):
     """Wait until SSH connection is ready."""
     ip = ip_address(server=server)
 
     attempt = -1
+    delay = 0.5
     start_time = time.time()
 
     while True:
@@ -56,19 +74,36 @@ def wait_ssh(server: BoundServer, timeout: float):
             stacklevel=3,
             server_name=server.name,
         ):
-            returncode = ssh(server, "hostname", check=False, stacklevel=4)
-            if returncode == 0:
-                break
+            # only try SSH once port 22 accepts connections
+            # to avoid wasting sshd unauthenticated connection slots
+            with ssh_startups:
+                if port_open(ip):
+                    returncode = ssh(server, "hostname", check=False, stacklevel=4)
+                    if returncode == 0:
+                        break
         if time.time() - start_time >= timeout:
             ssh(server, "hostname")
         else:
-            time.sleep(5)
+            time.sleep(min(delay, 10))
+            delay *= 1.5
 
 
 def ssh_command(server: BoundServer):
-    """Return ssh command."""
+    """Return ssh command.
+
+    Uses OpenSSH connection multiplexing (ControlMaster/ControlPersist)
+    so that repeated commands to the same server reuse one
+    authenticated connection instead of performing a full TCP and SSH
+    handshake each time.
+    """
     ip = ip_address(server=server)
-    return f'ssh -q -o "StrictHostKeyChecking no" root@{ip}'
+    return (
+        'ssh -q -o "StrictHostKeyChecking no" '
+        '-o "ControlMaster auto" '
+        '-o "ControlPath /tmp/github-hetzner-runner-ssh-%r@%h:%p" '
+        '-o "ControlPersist 60s" '
+        f"root@{ip}"
+    )
 
 
 def ssh(server: BoundServer, cmd: str, *args, stacklevel=3, **kwargs):
@@ -91,6 +126,8 @@ def scp(source: str, destination: str, *args, **kwargs):
 def wait_ready(server: BoundServer, timeout: float, action: Action = None):
     """Wait for server to be ready."""
     start_time = time.time()
+    delay = 1
+    last_status = None
 
     while True:
         status = server.status
@@ -100,5 +137,11 @@ def wait_ready(server: BoundServer, timeout: float, action: Action = None):
             break
         if time.time() - start_time >= timeout:
             raise TimeoutError("waiting for server to start running")
-        time.sleep(1)
+        if status != last_status:
+            # status changed, poll quickly again as the next
+            # transition is likely to be close
+            delay = 1
+        last_status = status
+        time.sleep(delay)
+        delay = min(delay * 1.3, 5)
         server.reload()
@@ -26,11 +26,13 @@ def shell(
     use_logger=True,
     stacklevel=2,
     server_name=None,
+    input: str = None,
 ):
     """Execute command."""
     p = subprocess.Popen(
         cmd,
         shell=shell,
+        stdin=subprocess.PIPE if input is not None else None,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         bufsize=1,
@@ -39,6 +41,10 @@ def shell(
         encoding="utf-8",
     )
 
+    if input is not None:
+        p.stdin.write(input)
+        p.stdin.close()
+
     for line in iter(p.stdout.readline, ""):
         if line == "":
             time.sleep(0.1)